@@ -5,6 +5,11 @@ Simple test script to verify the TDLR scraper is working correctly
 
 import sqlite3
 import os
+import json
+import tempfile
+import time
+
+from tldr_scraper import TDLRScraper, ProjectSearcher
 
 def test_database():
     """Test that the database was created correctly and has data"""
@@ -42,8 +47,224 @@ def test_database():
         conn.close()
         return False
 
+class FakeResponse:
+    """Just enough of requests.Response for the scraper."""
+    
+    def __init__(self, data):
+        self.status_code = 200
+        self.content = json.dumps(data).encode()
+    
+    def raise_for_status(self):
+        pass
+
+
+class FakeAPI:
+    """Mocked TDLR endpoint serving total_records numbered projects."""
+    
+    def __init__(self, total_records):
+        self.total_records = total_records
+        self.short_pages = {}  # start -> number of records to return once
+        self.failing_starts = set()  # starts that raise once
+        self.slow_starts = set()  # starts that answer after the pages behind them
+        self.facility_prefix = 'Facility'
+    
+    def post(self, url, data=None, timeout=None):
+        payload = json.loads(data)
+        start, length = payload['start'], payload['length']
+        
+        if start in self.failing_starts:
+            self.failing_starts.discard(start)
+            raise ConnectionError(f"simulated failure at {start}")
+        if start in self.slow_starts:
+            time.sleep(0.2)
+        
+        end = min(start + length, self.total_records)
+        if start in self.short_pages:
+            end = min(end, start + self.short_pages.pop(start))
+        
+        projects = [{'ProjectId': f'id-{i}', 'ProjectNumber': f'TABS{i:08d}',
+                     'ProjectName': f'Project {i}', 'FacilityName': f'{self.facility_prefix} {i}'}
+                    for i in range(start, end)]
+        return FakeResponse({'recordsTotal': self.total_records, 'data': projects})
+
+
+def scrape(db_path, api, **kwargs):
+    """Run one scrape against the fake API and return (saved, resume offset)."""
+    scraper = TDLRScraper(db_path)
+    scraper.session.post = api.post
+    try:
+        saved = scraper.scrape_all_projects(batch_size=100, delay=0, **kwargs)
+        return saved, scraper.get_resume_start()
+    finally:
+        scraper.close()
+
+
+def count_projects(db_path):
+    conn = sqlite3.connect(db_path)
+    count = conn.execute("SELECT COUNT(DISTINCT project_id) FROM projects").fetchone()[0]
+    conn.close()
+    return count
+
+
+def like_search(db_path, term, fields):
+    """Reference search with plain LIKE, returning the matching project_ids."""
+    conn = sqlite3.connect(db_path)
+    where = ' OR '.join(f"{field} LIKE ?" for field in fields)
+    rows = conn.execute(f"SELECT project_id FROM projects WHERE {where}",
+                        [f"%{term}%"] * len(fields)).fetchall()
+    conn.close()
+    return {row[0] for row in rows}
+
+
+def assert_search_matches_like(db_path, term, fields=None):
+    searcher = ProjectSearcher(db_path)
+    try:
+        columns, results = searcher.search_projects(term, fields)
+    finally:
+        searcher.close()
+    expected = like_search(db_path, term, fields or ['project_number', 'project_name', 'facility_name'])
+    assert expected
+    assert {row[0] for row in results} == expected
+
+
+def test_search_matches_like():
+    """The full-text index stays in sync with replaced rows and agrees with LIKE"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'projects.db')
+        api = FakeAPI(300)
+        api.failing_starts.add(100)
+        scrape(db_path, api)
+        
+        # The second run re-fetches from the gap, replacing the rows after it
+        api.facility_prefix = 'Site'
+        scrape(db_path, api)
+        
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO projects_fts(projects_fts) VALUES('integrity-check')")
+        assert conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0] == 300
+        # One index entry per row; replaced rows must have been removed from it
+        assert conn.execute("SELECT COUNT(*) FROM projects_fts_docsize").fetchone()[0] == 300
+        conn.close()
+        
+        assert_search_matches_like(db_path, '12')
+        assert_search_matches_like(db_path, 'fAcIlItY 25')
+        assert_search_matches_like(db_path, 'sItE 25')
+        assert_search_matches_like(db_path, 'id-27', ['project_id'])
+
+
+def test_search_without_fts_index():
+    """Databases created before the full-text index are searched with LIKE"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'projects.db')
+        conn = sqlite3.connect(db_path)
+        conn.execute('''
+            CREATE TABLE projects (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                project_id TEXT UNIQUE,
+                project_number TEXT,
+                project_name TEXT,
+                project_created_on TEXT,
+                project_status INTEGER,
+                facility_name TEXT,
+                city INTEGER,
+                county INTEGER,
+                type_of_work INTEGER,
+                estimated_cost REAL,
+                data_version_id INTEGER,
+                estimated_start_date TEXT,
+                estimated_end_date TEXT,
+                date_scraped TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.executemany("INSERT INTO projects (project_id, project_number, project_name, facility_name) VALUES (?, ?, ?, ?)",
+                         [(f'id-{i}', f'TABS{i:08d}', f'Project {i}', f'Facility {i}') for i in range(50)])
+        conn.commit()
+        conn.close()
+        
+        assert_search_matches_like(db_path, 'pRoJeCt 1')
+        assert_search_matches_like(db_path, '12')
+
+
+def test_close_commits_pending_batches():
+    """Batches saved outside scrape_all_projects survive close()"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'projects.db')
+        scraper = TDLRScraper(db_path)
+        try:
+            assert scraper.save_to_database([{'ProjectId': 'x1', 'ProjectNumber': 'TABS1'}]) == 1
+        finally:
+            scraper.close()
+        
+        assert count_projects(db_path) == 1
+
+
+def test_resume_after_short_page():
+    """A short page whose remainder can't be fetched must be picked up by the next run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'projects.db')
+        api = FakeAPI(1000)
+        api.short_pages[200] = 30
+        api.failing_starts.add(230)
+        
+        saved, resume_start = scrape(db_path, api)
+        assert saved == 930
+        assert resume_start == 230
+        
+        # Everything from the gap onwards is fetched again
+        saved, resume_start = scrape(db_path, api)
+        assert saved == 770
+        assert resume_start == 1000
+        assert count_projects(db_path) == 1000
+
+
+def test_short_page_is_refetched():
+    """A short page mid-range has its missing records fetched in the same run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'projects.db')
+        api = FakeAPI(1000)
+        api.short_pages[500] = 1
+        
+        saved, resume_start = scrape(db_path, api)
+        assert saved == 1000
+        assert resume_start == 1000
+        assert count_projects(db_path) == 1000
+
+
+def test_out_of_order_pages():
+    """Pages finishing out of order only advance progress over an unbroken run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'projects.db')
+        api = FakeAPI(1000)
+        api.slow_starts.update({0, 300})
+        api.failing_starts.add(600)
+        
+        saved, resume_start = scrape(db_path, api)
+        assert saved == 900
+        assert resume_start == 600
+        
+        saved, resume_start = scrape(db_path, api, max_records=150)
+        assert saved == 150
+        assert resume_start == 750
+        
+        saved, resume_start = scrape(db_path, api)
+        assert resume_start == 1000
+        assert count_projects(db_path) == 1000
+
+
 if __name__ == "__main__":
-    print("Testing TDLR Scraper Database...")
+    print("Testing TDLR Scraper resume logic...")
+    test_close_commits_pending_batches()
+    test_resume_after_short_page()
+    test_short_page_is_refetched()
+    test_out_of_order_pages()
+    print("\n✓ Resume tests PASSED")
+    
+    print("\nTesting TDLR Scraper search...")
+    test_search_matches_like()
+    test_search_without_fts_index()
+    print("\n✓ Search tests PASSED")
+    
+    print("\nTesting TDLR Scraper Database...")
     success = test_database()
     
     if success:
@@ -8,18 +8,99 @@ This version correctly accesses the API endpoint that returns JSON data.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import sqlite3
+import threading
 import time
 import argparse
 import json
-import uuid
 from urllib.parse import urljoin, urlparse
 import os
+import queue
 import sys
+from collections import deque
+from itertools import chain, islice
+from uuid import uuid4, uuid5, NAMESPACE_DNS
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# orjson parses the API responses several times faster; fall back to the
+# standard library when it isn't installed. Both accept the raw bytes.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+# Columns covered by the projects_fts full-text index
+FTS_COLUMNS = ('project_number', 'project_name', 'facility_name')
+
+# Columns returned by ProjectSearcher.search_projects, in display order
+SUMMARY_COLUMNS = ('project_id', 'project_number', 'facility_name', 'project_name')
+
+# JSON body of a page request, pre-serialized so only start and length are
+# filled in per request (the session already sends Content-Type: application/json)
+PAGE_REQUEST_BODY = b'{"draw": 1, "start": %d, "length": %d, "search-type": "default"}'
+
+# The API always honours pages of this size; larger ones are probed for
+MIN_PAGE_SIZE = 15
+PAGE_SIZE_CANDIDATES = (50, 100, 500, 1000)
+
+# Per-connection tuning: WAL lets searches read while the scraper writes, and
+# synchronous=NORMAL skips the fsync on every commit (still safe under WAL).
+# page_size only takes effect on a brand-new database file, so it has to come
+# before journal_mode=WAL writes the header.
+# recursive_triggers makes INSERT OR REPLACE fire the delete trigger that
+# keeps the full-text index in sync.
+SQLITE_PRAGMAS = '''
+    PRAGMA page_size=8192;
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA recursive_triggers=ON;
+'''
+
+# Shared by every batch so the connection's statement cache compiles it once
+INSERT_PREFIX = '''
+    INSERT OR REPLACE INTO projects 
+    (project_id, project_number, project_name, project_created_on, 
+     project_status, facility_name, city, county, type_of_work,
+     estimated_cost, data_version_id, estimated_start_date, estimated_end_date)
+    VALUES '''
+COLUMN_COUNT = 13
+ROW_PLACEHOLDERS = '(' + ', '.join(['?'] * COLUMN_COUNT) + ')'
+INSERT_SQL = INSERT_PREFIX + ROW_PLACEHOLDERS
+
+# Rows written per multi-row INSERT, keeping the parameters under the
+# 999-variable limit of older SQLite builds
+ROWS_PER_INSERT = 999 // COLUMN_COUNT
+
+
+class RateLimiter:
+    """Spaces out requests from any number of threads to at most rps per second."""
+    
+    def __init__(self, rps):
+        # None means unlimited; anything else must be a positive rate
+        if rps is not None and rps <= 0:
+            raise ValueError(f"rps must be positive, got {rps}")
+        self.interval = 1 / rps if rps else 0
+        self.next_slot = 0
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the next request may start; returns at once if under budget."""
+        with self.lock:
+            now = time.monotonic()
+            wait_time = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
 
 
 class TDLRScraper:
-    def __init__(self, db_path='tdlr_projects.db'):
+    def __init__(self, db_path='tdlr_projects.db', workers=8):
         self.base_url = 'https://www.tdlr.texas.gov'
         self.api_url = f'{self.base_url}/TABS/Search/SearchProjects'
         self.db_path = db_path
@@ -31,22 +112,56 @@ class TDLRScraper:
             'Accept': 'application/json, text/plain, */*'
         })
         
+        # Be respectful - don't hammer the server. One request per second
+        # until scrape_all_projects applies its delay/rps settings.
+        self.limiter = RateLimiter(1)
+        
+        # Number of pages fetched concurrently, with one kept-alive connection
+        # each, so no request pays for a new TCP/TLS handshake because the
+        # pool was too small
+        self.workers = workers
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+        
+        # Keep one connection open for the lifetime of the scraper
+        self.conn = self._connect()
+        
+        # Multi-row INSERT statements, keyed by row count
+        self._insert_statements = {}
+        
+        # Group commits: only commit once every this many batches
+        self._uncommitted = 0
+        self._commit_every = 100
+        
         # Initialize database
         self.init_database()
+        
+        # Fetched pages are written by a background thread, so database writes
+        # overlap with the next requests instead of holding them up
+        self._write_q = queue.Queue(maxsize=4)
+        self._total_saved = 0
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+    
+    def _connect(self):
+        """Open a connection to the database with the tuned PRAGMAs applied."""
+        # Transactions are opened explicitly with BEGIN, so skip the sqlite3
+        # module's per-statement check for whether to open one implicitly.
+        # The connection is shared with the writer thread, which never uses
+        # it at the same time as this one.
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.executescript(SQLITE_PRAGMAS)
+        return conn
     
     def init_database(self):
-        """Initialize the SQLite database with the required table."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Drop table if it exists (to handle schema changes)
-        cursor.execute('''DROP TABLE IF EXISTS projects''')
+        """Initialize the SQLite database, keeping any previously scraped data."""
+        cursor = self.conn.cursor()
         
-        # Create projects table
+        # Create projects table. project_id is made unique by an index built
+        # after the scrape (see build_indexes) rather than maintained per insert
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS projects (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id TEXT UNIQUE,
+                project_id TEXT,
                 project_number TEXT,
                 project_name TEXT,
                 project_created_on TEXT,
@@ -63,33 +178,82 @@ class TDLRScraper:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Full-text index over the searchable columns. The trigram tokenizer
+        # matches arbitrary substrings, like the LIKE '%term%' search it replaces
+        cursor.execute('''SELECT 1 FROM sqlite_master WHERE name = 'projects_fts' ''')
+        fts_exists = cursor.fetchone() is not None
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+                    project_number, project_name, facility_name,
+                    content='projects', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            # FTS5 or its trigram tokenizer (SQLite 3.34+) isn't available;
+            # searches fall back to scanning the table with LIKE
+            print(f"Full-text index unavailable ({e}); searches will scan the table")
+        else:
+            self._init_fts_triggers(cursor, fts_exists)
+        
+        # Offset up to which every page has been saved, so an interrupted or
+        # repeated scrape can pick up where the last one stopped
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_progress (
+                id INTEGER PRIMARY KEY,
+                last_start INTEGER
+            )
+        ''')
+        
+        self.conn.commit()
         print(f"Database initialized at {self.db_path}")
     
-    def scrape_all_projects(self, batch_size=15, delay=1, max_records=None):
+    def _init_fts_triggers(self, cursor, fts_existed):
+        """Create the triggers that keep projects_fts in sync with projects."""
+        cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS projects_fts_insert AFTER INSERT ON projects BEGIN
+                INSERT INTO projects_fts (rowid, project_number, project_name, facility_name)
+                VALUES (new.id, new.project_number, new.project_name, new.facility_name);
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS projects_fts_delete AFTER DELETE ON projects BEGIN
+                INSERT INTO projects_fts (projects_fts, rowid, project_number, project_name, facility_name)
+                VALUES ('delete', old.id, old.project_number, old.project_name, old.facility_name);
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS projects_fts_update AFTER UPDATE ON projects BEGIN
+                INSERT INTO projects_fts (projects_fts, rowid, project_number, project_name, facility_name)
+                VALUES ('delete', old.id, old.project_number, old.project_name, old.facility_name);
+                INSERT INTO projects_fts (rowid, project_number, project_name, facility_name)
+                VALUES (new.id, new.project_number, new.project_name, new.facility_name);
+            END;
+        ''')
+        
+        # Databases created before the index existed need it filled in
+        if not fts_existed:
+            cursor.execute('''INSERT INTO projects_fts (projects_fts) VALUES ('rebuild')''')
+    
+    def scrape_all_projects(self, batch_size=1000, delay=1, max_records=None, rps=None):
         """
         Scrape all project data from the API.
         
         Args:
-            batch_size (int): Number of records to fetch per request (max 15 based on API)
-            delay (int): Delay in seconds between requests
+            batch_size (int): Largest number of records to fetch per request; the page
+                size actually used is the largest one the API is found to honour
+            delay (int): Minimum delay in seconds between requests, used when rps is not given
             max_records (int): Maximum number of records to fetch (None for all)
+            rps (float): Maximum number of requests to start per second
         """
         print("Starting to scrape TDLR projects...")
         
-        # First, get total count to understand scope
-        payload = {
-            "draw": 1,
-            "start": 0,
-            "length": 1,
-            "search-type": "default"
-        }
+        # Be respectful - don't hammer the server
+        self.limiter = RateLimiter(rps if rps is not None else (1 / delay if delay else None))
         
+        # First, get total count to understand scope
         try:
-            response = self.session.post(self.api_url, json=payload, timeout=30)
+            response = self._post_page(0, 1)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 total_records = data.get('recordsTotal', 0)
                 print(f"Total records available: {total_records}")
                 if max_records:
@@ -101,133 +265,311 @@ class TDLRScraper:
             print(f"Error getting record count: {e}")
             return 0
         
-        # Now scrape in batches
-        total_saved = 0
-        start = 0
+        # Skip the records already saved by earlier runs
+        resume_start = self.get_resume_start()
+        if resume_start >= total_records:
+            print("All available records have already been scraped.")
+            return 0
+        if resume_start:
+            print(f"Resuming from record {resume_start}")
         
-        while True:
-            # Check if we've reached the maximum records requested
-            if max_records and total_saved >= max_records:
-                print(f"Reached the requested limit of {max_records} records.")
-                break
-                
-            # Adjust batch size if we're close to the limit
-            current_batch_size = min(batch_size, 15)  # API seems to max at 15
-            if max_records and total_saved + current_batch_size > max_records:
-                current_batch_size = max_records - total_saved
-                if current_batch_size <= 0:
-                    break
-            
-            print(f"Fetching records {start} to {start + current_batch_size}...")
+        end = min(total_records, resume_start + max_records) if max_records else total_records
+        
+        # Larger pages mean fewer round trips, so use the biggest one the API
+        # allows. The probe fetches the first page, which is saved like any other.
+        if max_records:
+            batch_size = min(batch_size, max_records)
+        page_size, first_page = self._probe_page_size(batch_size, resume_start, end)
+        
+        # Pages are independent once the total is known, so fetch several at
+        # once; the writer thread stays the only one writing to the database
+        rest_start = resume_start + len(first_page)
+        pages = deque((start, min(page_size, end - start)) for start in range(rest_start, end, page_size))
+        pending = {}
+        saved_before = self._total_saved
+        
+        # Pages finish out of order; the writer tracks which ones are saved so
+        # the recorded progress only ever covers an unbroken run of pages
+        self._progress = resume_start
+        self._saved_pages = {}
+        
+        def submit_next():
+            if pages:
+                start, length = pages.popleft()
+                future = pool.submit(self._fetch, start, length)
+                pending[future] = (start, length)
+        
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            if first_page:
+                self._write_q.put((resume_start, first_page))
             
-            payload = {
-                "draw": 1,
-                "start": start,
-                "length": current_batch_size,
-                "search-type": "default"
-            }
+            # Keep a bounded number of pages in flight
+            for _ in range(self.workers * 2):
+                submit_next()
             
-            try:
-                response = self.session.post(self.api_url, json=payload, timeout=30)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    projects = data.get('data', [])
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, length = pending.pop(future)
+                    try:
+                        projects = future.result()
+                    except requests.HTTPError as e:
+                        print(f"Failed to fetch records: {e}")
+                        pages.clear()
+                        continue
+                    except Exception as e:
+                        # Continue with next batch rather than stopping completely
+                        print(f"Error scraping batch starting at {start}: {e}")
+                        submit_next()
+                        continue
                     
                     if not projects:
                         print("No more projects to fetch.")
-                        break
-                    
-                    saved_count = self.save_to_database(projects)
-                    total_saved += saved_count
-                    
-                    print(f"Saved {saved_count} projects. Total saved: {total_saved}")
-                    
-                    # Check if we've reached the end
-                    if len(projects) < current_batch_size:
-                        print("Reached the end of available data.")
-                        break
-                    
-                    # Move to next batch
-                    start += len(projects)  # Use actual count, not requested count
+                        pages.clear()
+                        continue
                     
-                    # Check if we've reached the maximum records requested
-                    if max_records and total_saved >= max_records:
-                        print(f"Reached the requested limit of {max_records} records.")
-                        break
+                    # A short page is not the end of the data here, since the total
+                    # is known; fetch the missing records next rather than skip them
+                    if len(projects) < length:
+                        missing_start = start + len(projects)
+                        print(f"Got {len(projects)} of {length} records starting at {start}; "
+                              f"refetching records {missing_start} to {start + length}")
+                        pages.appendleft((missing_start, length - len(projects)))
                     
-                    # Be respectful - don't hammer the server
-                    time.sleep(delay)
-                else:
-                    print(f"Failed to fetch records. Status code: {response.status_code}")
-                    break
-                    
-            except KeyboardInterrupt:
-                print("\nScraping interrupted by user.")
-                break
-            except Exception as e:
-                print(f"Error scraping batch starting at {start}: {e}")
-                # Continue with next batch rather than stopping completely
-                start += 15  # Move forward by the typical batch size
-                time.sleep(delay)
+                    self._write_q.put((start, projects))
+                    submit_next()
+        except KeyboardInterrupt:
+            print("\nScraping interrupted by user.")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            # Let the writer save everything already queued, then flush batches
+            # still waiting on a group commit, even on interrupt
+            self._write_q.join()
+            self.commit()
+            self.build_indexes()
         
+        total_saved = self._total_saved - saved_before
         print(f"Finished scraping. Total projects saved: {total_saved}")
         return total_saved
     
+    def _fetch(self, start, length):
+        """Fetch one page of projects starting at the given offset."""
+        print(f"Fetching records {start} to {start + length}...")
+        
+        response = self._post_page(start, length)
+        response.raise_for_status()
+        return json_loads(response.content).get('data', [])
+    
+    def _post_page(self, start, length):
+        """POST a request for one page of results, once the rate limiter allows it."""
+        self.limiter.wait()
+        body = PAGE_REQUEST_BODY % (start, length)
+        return self.session.post(self.api_url, data=body, timeout=30)
+    
+    def _probe_page_size(self, batch_size, start, end):
+        """
+        Find the largest page size, up to batch_size, that the API honours.
+        
+        Sizes are tried largest first, requesting the page at start, so the
+        probe usually takes one request. Returns the page size and the projects
+        from the successful probe, which form the first page of the scrape.
+        """
+        fallback = min(batch_size, MIN_PAGE_SIZE)
+        candidates = sorted({size for size in PAGE_SIZE_CANDIDATES + (batch_size,)
+                             if fallback <= size <= batch_size}, reverse=True)
+        
+        for length in candidates:
+            requested = min(length, end - start)
+            try:
+                response = self._post_page(start, requested)
+                if response.status_code != 200:
+                    print(f"Page size {length} rejected. Status code: {response.status_code}")
+                    continue
+                projects = json_loads(response.content).get('data', [])
+            except Exception as e:
+                print(f"Error probing page size {length}: {e}")
+                continue
+            
+            if not projects:
+                break
+            
+            # A short page means the server caps requests at that many records
+            page_size = length if len(projects) >= requested else len(projects)
+            print(f"Using page size of {page_size} records per request")
+            return page_size, projects
+        
+        print(f"Using page size of {fallback} records per request")
+        return fallback, []
+    
+    def _writer_loop(self):
+        """Save queued pages of projects until close() sends None."""
+        while True:
+            item = self._write_q.get()
+            try:
+                if item is None:
+                    return
+                
+                start, projects = item
+                saved_count = self.save_to_database(projects)
+                self._total_saved += saved_count
+                print(f"Saved {saved_count} projects. Total saved: {self._total_saved}")
+                
+                # Only the records actually received count as done; a short
+                # page leaves a gap that stops progress until it is filled
+                self._record_progress(start, start + len(projects))
+            except Exception as e:
+                print(f"Error saving batch: {e}")
+            finally:
+                self._write_q.task_done()
+    
+    def get_resume_start(self):
+        """Return the offset up to which earlier scrapes saved every page."""
+        cursor = self.conn.cursor()
+        cursor.execute('''SELECT last_start FROM scrape_progress WHERE id = 1''')
+        row = cursor.fetchone()
+        return row[0] if row else 0
+    
+    def _record_progress(self, start, next_start):
+        """Mark the page at start as saved and advance the stored resume offset."""
+        self._saved_pages[start] = next_start
+        if start != self._progress:
+            return
+        
+        while self._progress in self._saved_pages:
+            self._progress = self._saved_pages.pop(self._progress)
+        
+        # Written in the open transaction, so it is committed together with
+        # (or after) the rows it covers, never before them
+        if not self.conn.in_transaction:
+            self.conn.execute('BEGIN')
+        self.conn.execute('''INSERT OR REPLACE INTO scrape_progress (id, last_start) VALUES (1, ?)''',
+                          (self._progress,))
+    
     def save_to_database(self, projects_data):
         """Save scraped project data to the SQLite database."""
         if not projects_data:
             return 0
             
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
-        saved_count = 0
-        for project in projects_data:
-            try:
-                # Handle missing project_id by generating a UUID
-                project_id = project.get('ProjectId')
-                if not project_id:
-                    # Generate a UUID based on project number if available, otherwise random
-                    project_number = project.get('ProjectNumber', '')
-                    if project_number:
-                        # Create a deterministic UUID based on project number
-                        project_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, project_number))
-                    else:
-                        # Generate a random UUID
-                        project_id = str(uuid.uuid4())
-                
-                cursor.execute('''
-                    INSERT OR REPLACE INTO projects 
-                    (project_id, project_number, project_name, project_created_on, 
-                     project_status, facility_name, city, county, type_of_work,
-                     estimated_cost, data_version_id, estimated_start_date, estimated_end_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    project_id,  # Fixed: Use generated or existing project_id
-                    project.get('ProjectNumber'),
-                    project.get('ProjectName'),
-                    project.get('ProjectCreatedOn'),
-                    project.get('ProjectStatus'),
-                    project.get('FacilityName'),
-                    project.get('City'),
-                    project.get('County'),
-                    project.get('TypeOfWork'),
-                    project.get('EstimatedCost'),
-                    project.get('DataVersionId'),
-                    project.get('EstimatedStartDate'),
-                    project.get('EstimatedEndDate')
-                ))
-                saved_count += 1
-            except sqlite3.Error as e:
-                print(f"Database error saving project {project.get('ProjectNumber')}: {e}")
-            except Exception as e:
-                print(f"Unexpected error saving project {project.get('ProjectNumber')}: {e}")
+        # Batches share one long transaction; the savepoint lets us undo
+        # just this batch without losing the uncommitted ones before it
+        if not conn.in_transaction:
+            conn.execute('BEGIN')
+        conn.execute('SAVEPOINT batch')
         
-        conn.commit()
-        conn.close()
+        try:
+            # Write the batch as a few multi-row INSERTs rather than binding
+            # and stepping the single-row statement once per project. Rows are
+            # generated straight into each statement's flat parameter list.
+            rows = self._project_rows(projects_data)
+            saved_count = 0
+            while True:
+                params = list(chain.from_iterable(islice(rows, ROWS_PER_INSERT)))
+                if not params:
+                    break
+                row_count = len(params) // COLUMN_COUNT
+                cursor.execute(self._insert_statement(row_count), params)
+                saved_count += row_count
+        except Exception as e:
+            # Undo whatever part of the batch was written, then fall back to
+            # row-by-row inserts so one bad project doesn't sink the batch
+            conn.execute('ROLLBACK TO batch')
+            print(f"Batch insert failed ({e}), retrying row by row...")
+            saved_count = 0
+            for project in projects_data:
+                try:
+                    cursor.execute(INSERT_SQL, self._project_row(project))
+                    saved_count += 1
+                except sqlite3.Error as e:
+                    print(f"Database error saving project {project.get('ProjectNumber')}: {e}")
+                except Exception as e:
+                    print(f"Unexpected error saving project {project.get('ProjectNumber')}: {e}")
+        
+        conn.execute('RELEASE batch')
+        
+        self._uncommitted += 1
+        if self._uncommitted >= self._commit_every:
+            self.commit()
         
         return saved_count
+    
+    def _insert_statement(self, row_count):
+        """Return an INSERT statement that writes row_count projects at once."""
+        statement = self._insert_statements.get(row_count)
+        if statement is None:
+            statement = INSERT_PREFIX + ', '.join([ROW_PLACEHOLDERS] * row_count)
+            self._insert_statements[row_count] = statement
+        return statement
+    
+    def commit(self):
+        """Commit any batches saved since the last commit."""
+        self.conn.commit()
+        self._uncommitted = 0
+    
+    def build_indexes(self):
+        """Create the project_id and date_scraped indexes once the bulk load is done."""
+        cursor = self.conn.cursor()
+        if not self.conn.in_transaction:
+            cursor.execute('BEGIN')
+        
+        # Without the constraint during the load a project fetched twice is
+        # stored twice; keep the latest copy, as INSERT OR REPLACE would have
+        cursor.execute('''
+            DELETE FROM projects WHERE id NOT IN (
+                SELECT MAX(id) FROM projects GROUP BY project_id
+            )
+        ''')
+        cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_project_id ON projects(project_id)''')
+        
+        # Lets searches walk the newest rows first and stop at the LIMIT
+        # instead of sorting every match
+        cursor.execute('''CREATE INDEX IF NOT EXISTS idx_date_scraped ON projects(date_scraped DESC)''')
+        
+        self.conn.commit()
+    
+    def close(self):
+        """Stop the writer thread, commit pending batches and close the database connection."""
+        self._write_q.put(None)
+        self._writer.join()
+        self.commit()
+        self.conn.close()
+    
+    def _project_rows(self, projects):
+        """Return a lazy iterator over the INSERT parameter tuples for projects."""
+        return map(self._project_row, projects)
+    
+    def _project_row(self, project):
+        """Build the INSERT parameter tuple for a single project."""
+        # Handle missing project_id by generating a UUID
+        project_id = project.get('ProjectId')
+        project_number = project.get('ProjectNumber')
+        if not project_id:
+            # Generate a UUID based on project number if available, otherwise random
+            if project_number:
+                # Create a deterministic UUID based on project number
+                project_id = str(uuid5(NAMESPACE_DNS, project_number))
+            else:
+                # Generate a random UUID
+                project_id = str(uuid4())
+        
+        return (
+            project_id,
+            project_number,
+            project.get('ProjectName'),
+            project.get('ProjectCreatedOn'),
+            project.get('ProjectStatus'),
+            project.get('FacilityName'),
+            project.get('City'),
+            project.get('County'),
+            project.get('TypeOfWork'),
+            project.get('EstimatedCost'),
+            project.get('DataVersionId'),
+            project.get('EstimatedStartDate'),
+            project.get('EstimatedEndDate')
+        )
 
 
 class ProjectSearcher:
@@ -238,31 +580,63 @@ class ProjectSearcher:
         if not os.path.exists(self.db_path):
             print(f"Database {self.db_path} not found.")
             sys.exit(1)
+        
+        self.conn = self._connect()
+        
+        # Databases from older versions, or built where FTS5 trigrams aren't
+        # supported, have no full-text index and are searched with LIKE only
+        cursor = self.conn.execute("""SELECT 1 FROM sqlite_master WHERE name = 'projects_fts'""")
+        self.has_fts = cursor.fetchone() is not None
+    
+    def _connect(self):
+        """Open a connection to the database with the tuned PRAGMAs applied."""
+        # Transactions are opened explicitly with BEGIN, so skip the sqlite3
+        # module's per-statement check for whether to open one implicitly
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.executescript(SQLITE_PRAGMAS)
+        return conn
     
     def search_projects(self, search_term, search_fields=None):
-        """Search for projects in the database."""
+        """Search for projects in the database, returning only the summary columns."""
+        return self._search(search_term, search_fields, SUMMARY_COLUMNS)
+    
+    def search_projects_full(self, search_term, search_fields=None):
+        """Search for projects in the database, returning every column."""
+        return self._search(search_term, search_fields, None)
+    
+    def _search(self, search_term, search_fields, select_columns):
+        """Run a project search, selecting select_columns (all columns if None)."""
         if search_fields is None:
             search_fields = ['project_number', 'project_name', 'facility_name']
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        
+        selected = ', '.join(select_columns) if select_columns else '*'
+        
+        # Fields in the full-text index are matched through it; trigrams can't
+        # index terms shorter than three characters, and any other column
+        # (or a database without the index) is searched with LIKE
+        if self.has_fts and len(search_term) >= 3:
+            fts_fields = [field for field in search_fields if field in FTS_COLUMNS]
+        else:
+            fts_fields = []
+        like_fields = [field for field in search_fields if field not in fts_fields]
         
-        # Build query dynamically
         conditions = []
         params = []
         
-        # Support for different search term formats
-        search_patterns = [
-            search_term,  # Exact match
-            f"%{search_term}%",  # Contains
-        ]
+        if fts_fields:
+            # Quote the term so FTS5 treats it as a literal string, and
+            # restrict the match to the requested columns
+            phrase = '"' + search_term.replace('"', '""') + '"'
+            conditions.append("id IN (SELECT rowid FROM projects_fts WHERE projects_fts MATCH ?)")
+            params.append(f"{{{' '.join(fts_fields)}}} : {phrase}")
         
-        for field in search_fields:
-            for pattern in search_patterns:
-                conditions.append(f"{field} LIKE ?")
-                params.append(pattern)
+        for field in like_fields:
+            conditions.append(f"{field} LIKE ?")
+            params.append(f"%{search_term}%")
         
-        query = f"SELECT * FROM projects WHERE {' OR '.join(conditions)} ORDER BY date_scraped DESC LIMIT 100"
+        query = f"SELECT {selected} FROM projects WHERE {' OR '.join(conditions)} ORDER BY date_scraped DESC LIMIT 100"
         
         try:
             cursor.execute(query, params)
@@ -271,12 +645,38 @@ class ProjectSearcher:
             # Get column names
             column_names = [description[0] for description in cursor.description]
             
-            conn.close()
             return column_names, results
         except sqlite3.Error as e:
             print(f"Database error: {e}")
-            conn.close()
             return [], []
+    
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+
+def positive_float(value):
+    """argparse type for options that must be greater than zero."""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def non_negative_float(value):
+    """argparse type for options that must be zero or greater."""
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {value}")
+    return number
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least one."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
 
 
 def main():
@@ -284,21 +684,27 @@ def main():
     parser.add_argument('--scrape', action='store_true', help='Scrape project data from TDLR website')
     parser.add_argument('--search', type=str, help='Search for projects in the database')
     parser.add_argument('--db-path', type=str, default='tdlr_projects.db', help='Path to SQLite database')
-    parser.add_argument('--batch-size', type=int, default=15, help='Number of records to fetch per request (default: 15)')
-    parser.add_argument('--delay', type=float, default=1.0, help='Delay in seconds between requests (default: 1.0)')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Maximum number of records to fetch per request (default: 1000)')
+    parser.add_argument('--delay', type=non_negative_float, default=1.0, help='Delay in seconds between requests; 0 disables it (default: 1.0)')
+    parser.add_argument('--rps', type=positive_float, help='Maximum requests per second; overrides --delay (default: 1 / delay)')
     parser.add_argument('--max-records', type=int, help='Maximum number of records to fetch (default: all)')
+    parser.add_argument('--workers', type=positive_int, default=8, help='Number of requests to run concurrently (default: 8)')
     
     args = parser.parse_args()
     
     if args.scrape:
         print("Starting TDLR project scraping...")
-        scraper = TDLRScraper(args.db_path)
+        scraper = TDLRScraper(args.db_path, workers=args.workers)
         
-        count = scraper.scrape_all_projects(
-            batch_size=args.batch_size, 
-            delay=args.delay,
-            max_records=args.max_records
-        )
+        try:
+            count = scraper.scrape_all_projects(
+                batch_size=args.batch_size, 
+                delay=args.delay,
+                rps=args.rps,
+                max_records=args.max_records
+            )
+        finally:
+            scraper.close()
         print(f"Successfully saved {count} projects to database.")
     
     elif args.search:
@@ -306,6 +712,7 @@ def main():
         searcher = ProjectSearcher(args.db_path)
         
         columns, results = searcher.search_projects(args.search)
+        searcher.close()
         
         if results:
             print(f"\nFound {len(results)} projects:")
@@ -322,10 +729,10 @@ def main():
                     print(f"... and {len(results) - 20} more results")
                     break
                     
-                # Extract key fields (adjust indices based on your table structure)
-                project_id = str(row[1])[:35] if row[1] else ""
-                project_number = str(row[2])[:14] if row[2] else ""
-                facility_name = str(row[6])[:19] if row[6] else ""
+                # Extract key fields (in SUMMARY_COLUMNS order)
+                project_id = str(row[0])[:35] if row[0] else ""
+                project_number = str(row[1])[:14] if row[1] else ""
+                facility_name = str(row[2])[:19] if row[2] else ""
                 project_name = str(row[3])[:19] if row[3] else ""
                 
                 print("{:<36} {:<15} {:<20} {:<20}".format(project_id, project_number, facility_name, project_name))